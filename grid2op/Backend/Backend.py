@@ -511,6 +511,102 @@ class Backend(GridObjects, ABC):
         p_or, q_or, v_or, a_or = self.lines_or_info()
         return a_or
 
+    def generators_info_into(self, prod_p, prod_q, prod_v):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Same as :func:`Backend.generators_info` but the results are written in the arrays given as input (for example
+        the ones of an observation) instead of being returned in newly allocated arrays.
+
+        By default it relies on :func:`Backend.generators_info`. Backends that store these values can overload it
+        to copy them directly.
+
+        Parameters
+        ----------
+        prod_p: ``numpy.ndarray``
+            Where to write the "prod_p" returned by :func:`Backend.generators_info`
+        prod_q: ``numpy.ndarray``
+            Where to write the "prod_q" returned by :func:`Backend.generators_info`
+        prod_v: ``numpy.ndarray``
+            Where to write the "prod_v" returned by :func:`Backend.generators_info`
+        """
+        prod_p[:], prod_q[:], prod_v[:] = self.generators_info()
+
+    def loads_info_into(self, load_p, load_q, load_v):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Same as :func:`Backend.loads_info` but the results are written in the arrays given as input (for example
+        the ones of an observation) instead of being returned in newly allocated arrays.
+
+        By default it relies on :func:`Backend.loads_info`. Backends that store these values can overload it
+        to copy them directly.
+
+        Parameters
+        ----------
+        load_p: ``numpy.ndarray``
+            Where to write the "load_p" returned by :func:`Backend.loads_info`
+        load_q: ``numpy.ndarray``
+            Where to write the "load_q" returned by :func:`Backend.loads_info`
+        load_v: ``numpy.ndarray``
+            Where to write the "load_v" returned by :func:`Backend.loads_info`
+        """
+        load_p[:], load_q[:], load_v[:] = self.loads_info()
+
+    def lines_or_info_into(self, p_or, q_or, v_or, a_or):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Same as :func:`Backend.lines_or_info` but the results are written in the arrays given as input (for example
+        the ones of an observation) instead of being returned in newly allocated arrays.
+
+        By default it relies on :func:`Backend.lines_or_info`. Backends that store these values can overload it
+        to copy them directly.
+
+        Parameters
+        ----------
+        p_or: ``numpy.ndarray``
+            Where to write the "p_or" returned by :func:`Backend.lines_or_info`
+        q_or: ``numpy.ndarray``
+            Where to write the "q_or" returned by :func:`Backend.lines_or_info`
+        v_or: ``numpy.ndarray``
+            Where to write the "v_or" returned by :func:`Backend.lines_or_info`
+        a_or: ``numpy.ndarray``
+            Where to write the "a_or" returned by :func:`Backend.lines_or_info`
+        """
+        p_or[:], q_or[:], v_or[:], a_or[:] = self.lines_or_info()
+
+    def lines_ex_info_into(self, p_ex, q_ex, v_ex, a_ex):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Same as :func:`Backend.lines_ex_info` but the results are written in the arrays given as input (for example
+        the ones of an observation) instead of being returned in newly allocated arrays.
+
+        By default it relies on :func:`Backend.lines_ex_info`. Backends that store these values can overload it
+        to copy them directly.
+
+        Parameters
+        ----------
+        p_ex: ``numpy.ndarray``
+            Where to write the "p_ex" returned by :func:`Backend.lines_ex_info`
+        q_ex: ``numpy.ndarray``
+            Where to write the "q_ex" returned by :func:`Backend.lines_ex_info`
+        v_ex: ``numpy.ndarray``
+            Where to write the "v_ex" returned by :func:`Backend.lines_ex_info`
+        a_ex: ``numpy.ndarray``
+            Where to write the "a_ex" returned by :func:`Backend.lines_ex_info`
+        """
+        p_ex[:], q_ex[:], v_ex[:], a_ex[:] = self.lines_ex_info()
+
     def set_thermal_limit(self, limits):
         """
         INTERNAL
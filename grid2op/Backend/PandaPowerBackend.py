@@ -1178,6 +1178,28 @@ class PandaPowerBackend(Backend):
     def lines_ex_info(self):
         return self.cst_1 * self.p_ex, self.cst_1 * self.q_ex, self.cst_1 * self.v_ex, self.cst_1 * self.a_ex
 
+    def generators_info_into(self, prod_p, prod_q, prod_v):
+        prod_p[:] = self.prod_p
+        prod_q[:] = self.prod_q
+        prod_v[:] = self.prod_v
+
+    def loads_info_into(self, load_p, load_q, load_v):
+        load_p[:] = self.load_p
+        load_q[:] = self.load_q
+        load_v[:] = self.load_v
+
+    def lines_or_info_into(self, p_or, q_or, v_or, a_or):
+        p_or[:] = self.p_or
+        q_or[:] = self.q_or
+        v_or[:] = self.v_or
+        a_or[:] = self.a_or
+
+    def lines_ex_info_into(self, p_ex, q_ex, v_ex, a_ex):
+        p_ex[:] = self.p_ex
+        q_ex[:] = self.q_ex
+        v_ex[:] = self.v_ex
+        a_ex[:] = self.a_ex
+
     def shunt_info(self):
         shunt_p = self.cst_1 * self._grid.res_shunt["p_mw"].values.astype(dt_float)
         shunt_q = self.cst_1 * self._grid.res_shunt["q_mvar"].values.astype(dt_float)
@@ -417,8 +417,10 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         self._is_alarm_used_in_reward = False
         self._kwargs_attention_budget = copy.deepcopy(kwargs_attention_budget)
 
-    def _custom_deepcopy_for_copy(self, new_obj):
+    def _custom_deepcopy_for_copy(self, new_obj, dict_=None):
         RandomObject._custom_deepcopy_for_copy(self, new_obj)
+        if dict_ is None:
+            dict_ = {}
 
         new_obj._init_grid_path = copy.deepcopy(self._init_grid_path)
         new_obj._DEBUG = self._DEBUG
@@ -514,7 +516,11 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         # to use the data
         new_obj.done = self.done
         new_obj.current_reward = copy.deepcopy(self.current_reward)
-        new_obj.chronics_handler = copy.deepcopy(self.chronics_handler)
+        if "chronics_handler" in dict_:
+            # the caller provides its own chronics handler, no need to copy the one of self
+            new_obj.chronics_handler = dict_["chronics_handler"]
+        else:
+            new_obj.chronics_handler = copy.deepcopy(self.chronics_handler)
         new_obj._game_rules = copy.deepcopy(self._game_rules)
         new_obj._helper_action_env = self._helper_action_env.copy()
         new_obj._helper_action_env.legal_action = new_obj._game_rules.legal_action
@@ -531,8 +537,10 @@ class BaseEnv(GridObjects, RandomObject, ABC):
 
         # gym compatibility
         new_obj.reward_range = copy.deepcopy(self.reward_range)
-        new_obj.viewer = copy.deepcopy(self.viewer)
-        new_obj.viewer_fig = copy.deepcopy(self.viewer_fig)
+        # the renderer holds matplotlib objects (figure, axes) that cannot be shared between environments and
+        # are expensive to copy: the copy will create its own renderer if (and when) it is rendered
+        new_obj.viewer = None
+        new_obj.viewer_fig = None
 
         # other rewards
         new_obj.other_rewards = copy.deepcopy(self.other_rewards)
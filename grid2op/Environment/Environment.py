@@ -25,8 +25,6 @@ from grid2op.Environment.BaseEnv import BaseEnv
 from grid2op.Opponent import BaseOpponent, NeverAttackBudget
 from grid2op.operator_attention import LinearAttentionBudget
 
-from grid2op.Backend import PandaPowerBackend
-
 
 class Environment(BaseEnv):
     """
@@ -56,9 +54,21 @@ class Environment(BaseEnv):
     viewer: ``object``
         Used to display the powergrid. Currently not supported.
 
+    Notes
+    -----
+    By default, the environment performs a first "do nothing" step when it is created and then checks that the
+    backend returns objects of the proper sizes
+    (see :func:`grid2op.Backend.Backend.assert_grid_correct_after_powerflow`).
+
+    If it is built with ``_validate_at_init=False`` (internal parameter) this step and these checks are
+    postponed to the first call to :func:`Environment.reset`. Such an environment cannot be used before it has been
+    reset: calling :func:`Environment.step` or :func:`Environment.simulate` before that raises an
+    :class:`grid2op.Exceptions.EnvError`.
+
     """
 
-    REGEX_SPLIT = r"^[a-zA-Z0-9]*$"
+    REGEX_SPLIT = re.compile(r"^[a-zA-Z0-9]*$", re.ASCII)
+    REGEX_REMOVE_FROM_NAME = re.compile(r"^[a-zA-Z0-9\\^\\$_]*$")
 
     def __init__(self,
                  init_grid_path: str,
@@ -91,6 +101,7 @@ class Environment(BaseEnv):
                  _raw_backend_class=None,
                  _compat_glop_version=None,
                  _read_from_local_dir=True,  # TODO runner and all here !
+                 _validate_at_init=True,
                  ):
         BaseEnv.__init__(self,
                          init_grid_path=init_grid_path,
@@ -134,6 +145,10 @@ class Environment(BaseEnv):
 
         self._compat_glop_version = _compat_glop_version
 
+        # if False, the initial "do nothing" step (and the checks of the backend after a powerflow) are
+        # postponed to the first call to "reset"
+        self._validate_at_init = _validate_at_init
+        self._backend_checked_after_pf = False
         # for plotting
         self._init_backend(chronics_handler, backend,
                            names_chronics_to_backend, actionClass, observationClass,
@@ -169,17 +184,18 @@ class Environment(BaseEnv):
             raise EnvError("Impossible to use the same backend twice. Please create your environment with a "
                            "new backend instance.")
 
+        env_path = self.get_path_env()
         if self._read_from_local_dir:
             # test to support pickle conveniently
-            self.backend._PATH_ENV = self.get_path_env()
+            self.backend._PATH_ENV = env_path
 
         # all the above should be done in this exact order, otherwise some weird behaviour might occur
         # this is due to the class attribute
         self.backend.set_env_name(self.name)
         self.backend.load_grid(self._init_grid_path)  # the real powergrid of the environment
-        self.backend.load_redispacthing_data(self.get_path_env())
-        self.backend.load_storage_data(self.get_path_env())
-        exc_ = self.backend.load_grid_layout(self.get_path_env())
+        self.backend.load_redispacthing_data(env_path)
+        self.backend.load_storage_data(env_path)
+        exc_ = self.backend.load_grid_layout(env_path)
         if exc_ is not None:
             warnings.warn(f"No layout have been found for you grid (or the layout provided was corrupted). You will "
                           f"not be able to use the renderer, plot the grid etc. The error was \"{exc_}\"")
@@ -195,12 +211,14 @@ class Environment(BaseEnv):
         self._has_been_initialized()  # really important to include this piece of code! and just here after the
         # backend has loaded everything
         self._line_status = np.ones(shape=self.n_line, dtype=dt_bool)
-        self._disc_lines = np.zeros(shape=self.n_line, dtype=dt_int) - 1
+        self._disc_lines = np.full(shape=self.n_line, fill_value=-1, dtype=dt_int)
 
         if self._thermal_limit_a is None:
+            # a real copy is needed here: the backend might modify its thermal limits inplace
             self._thermal_limit_a = self.backend.thermal_limit_a.astype(dt_float)
         else:
-            self.backend.set_thermal_limit(self._thermal_limit_a.astype(dt_float))
+            # backend.set_thermal_limit already copies its input
+            self.backend.set_thermal_limit(self._thermal_limit_a.astype(dt_float, copy=False))
 
         *_, tmp = self.backend.generators_info()
 
@@ -258,16 +276,7 @@ class Environment(BaseEnv):
                                                             legal_action=self._game_rules.legal_action)
 
         # handles input data
-        if not isinstance(chronics_handler, ChronicsHandler):
-            raise Grid2OpException(
-                "Parameter \"chronics_handler\" used to build the Environment should derived form the "
-                "grid2op.ChronicsHandler class, type provided is \"{}\"".format(
-                    type(chronics_handler)))
-        self.chronics_handler = chronics_handler
-        self.chronics_handler.initialize(self.name_load, self.name_gen,
-                                         self.name_line, self.name_sub,
-                                         names_chronics_to_backend=names_chronics_to_backend)
-        self._names_chronics_to_backend = names_chronics_to_backend
+        self._init_chronics_handler(chronics_handler, names_chronics_to_backend)
 
         # this needs to be done after the chronics handler: rewards might need information
         # about the chronics to work properly.
@@ -278,9 +287,6 @@ class Environment(BaseEnv):
                                                                  rewardClass=rewardClass,
                                                                  env=self)
 
-        # test to make sure the backend is consistent with the chronics generator
-        self.chronics_handler.check_validity(self.backend)
-        self.delta_time_seconds = dt_float(self.chronics_handler.time_interval.seconds)
         self._reset_storage()  # this should be called after the  self.delta_time_seconds is set
 
         # reward function
@@ -308,14 +314,16 @@ class Environment(BaseEnv):
         # first injections given)
         self._reset_maintenance()
         self._reset_redispatching()
-        do_nothing = self._helper_action_env({})
-        *_, fail_to_start, info = self.step(do_nothing)
-        if fail_to_start:
-            raise Grid2OpException("Impossible to initialize the powergrid, the powerflow diverge at iteration 0. "
-                                   "Available information are: {}".format(info))
+        if self._validate_at_init:
+            do_nothing = self._helper_action_env({})
+            *_, fail_to_start, info = self.step(do_nothing)
+            if fail_to_start:
+                raise Grid2OpException("Impossible to initialize the powergrid, the powerflow diverge at iteration 0. "
+                                       "Available information are: {}".format(info))
 
-        # test the backend returns object of the proper size
-        self.backend.assert_grid_correct_after_powerflow()
+            # test the backend returns object of the proper size
+            self.backend.assert_grid_correct_after_powerflow()
+            self._backend_checked_after_pf = True
 
         # for gym compatibility
         self.reward_range = self._reward_helper.range()
@@ -331,6 +339,30 @@ class Environment(BaseEnv):
         # reset everything to be consistent
         self._reset_vectors_and_timings()
 
+    def _init_chronics_handler(self, chronics_handler, names_chronics_to_backend):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Bind the `chronics_handler` to this environment: initialize it with the names of the elements of the grid
+        and make sure it is consistent with the backend.
+        """
+        if not isinstance(chronics_handler, ChronicsHandler):
+            raise Grid2OpException(
+                "Parameter \"chronics_handler\" used to build the Environment should derived form the "
+                "grid2op.ChronicsHandler class, type provided is \"{}\"".format(
+                    type(chronics_handler)))
+        self.chronics_handler = chronics_handler
+        self.chronics_handler.initialize(self.name_load, self.name_gen,
+                                         self.name_line, self.name_sub,
+                                         names_chronics_to_backend=names_chronics_to_backend)
+        self._names_chronics_to_backend = names_chronics_to_backend
+
+        # test to make sure the backend is consistent with the chronics generator
+        self.chronics_handler.check_validity(self.backend)
+        self.delta_time_seconds = dt_float(self.chronics_handler.time_interval.seconds)
+
     def max_episode_duration(self):
         """
         Return the maximum duration (in number of steps) of the current episode.
@@ -385,38 +417,45 @@ class Environment(BaseEnv):
                 # oldest version: no storage and no curtailment available
                 # deactivate storage
                 # recompute the topology vector (more or less everything need to be adjusted...
-                stor_locs = [pos for pos in cls_bk.storage_pos_topo_vect]
-                for stor_loc in sorted(stor_locs, reverse=True):
-                    for vect in [cls_bk.load_pos_topo_vect, cls_bk.gen_pos_topo_vect,
-                                 cls_bk.line_or_pos_topo_vect, cls_bk.line_ex_pos_topo_vect]:
-                        vect[vect >= stor_loc] -= 1
-
-                # deals with the "sub_pos" vector
-                for sub_id in range(cls_bk.n_sub):
-                    if np.any(cls_bk.storage_to_subid == sub_id):
-                        stor_ids = np.where(cls_bk.storage_to_subid == sub_id)[0]
-                        stor_locs = cls_bk.storage_to_sub_pos[stor_ids]
-                        for stor_loc in sorted(stor_locs, reverse=True):
-                            for vect, sub_id_me in zip([cls_bk.load_to_sub_pos, cls_bk.gen_to_sub_pos,
-                                                        cls_bk.line_or_to_sub_pos, cls_bk.line_ex_to_sub_pos],
-                                                       [cls_bk.load_to_subid, cls_bk.gen_to_subid,
-                                                        cls_bk.line_or_to_subid, cls_bk.line_ex_to_subid]):
-                                vect[(vect >= stor_loc) & (sub_id_me == sub_id)] -= 1
+                # for each type of element (except storage): (to_subid, to_sub_pos, pos_topo_vect)
+                topo_elements = [(cls_bk.load_to_subid, cls_bk.load_to_sub_pos, cls_bk.load_pos_topo_vect),
+                                 (cls_bk.gen_to_subid, cls_bk.gen_to_sub_pos, cls_bk.gen_pos_topo_vect),
+                                 (cls_bk.line_or_to_subid, cls_bk.line_or_to_sub_pos, cls_bk.line_or_pos_topo_vect),
+                                 (cls_bk.line_ex_to_subid, cls_bk.line_ex_to_sub_pos, cls_bk.line_ex_pos_topo_vect)]
+
+                # each element is shifted by the number of storage units located before it
+                stor_locs = np.sort(cls_bk.storage_pos_topo_vect)
+                for _, _, vect in topo_elements:
+                    vect -= np.searchsorted(stor_locs, vect, side="right").astype(vect.dtype, copy=False)
+
+                # number of storage units per substation
+                nb_stor_per_sub = np.bincount(cls_bk.storage_to_subid, minlength=cls_bk.n_sub)
+
+                # deals with the "sub_pos" vector: each element is shifted by the number of storage units
+                # of its substation located before it. To process all the substations at once, the
+                # position "sub_pos" in substation "sub_id" is encoded as "sub_id * key_stride + sub_pos"
+                key_stride = np.max(cls_bk.sub_info) + 1
+                stor_keys = np.sort(cls_bk.storage_to_subid.astype(np.int64) * key_stride + cls_bk.storage_to_sub_pos)
+                for sub_id_me, vect, _ in topo_elements:
+                    sub_keys = sub_id_me.astype(np.int64) * key_stride
+                    nb_stor_before = np.searchsorted(stor_keys, sub_keys + vect, side="right")
+                    nb_stor_before -= np.searchsorted(stor_keys, sub_keys, side="left")
+                    vect -= nb_stor_before.astype(vect.dtype, copy=False)
 
                 # remove storage from the number of element in the substation
-                for sub_id in range(cls_bk.n_sub):
-                    cls_bk.sub_info[sub_id] -= np.sum(cls_bk.storage_to_subid == sub_id)
+                cls_bk.sub_info -= nb_stor_per_sub.astype(cls_bk.sub_info.dtype, copy=False)
                 # remove storage from the total number of element
                 cls_bk.dim_topo -= cls_bk.n_storage
 
                 # recompute this private member
-                cls_bk._topo_vect_to_sub = np.repeat(np.arange(cls_bk.n_sub), repeats=cls_bk.sub_info)
-                self.backend._topo_vect_to_sub = np.repeat(np.arange(cls_bk.n_sub), repeats=cls_bk.sub_info)
+                topo_vect_to_sub = np.repeat(np.arange(cls_bk.n_sub), repeats=cls_bk.sub_info)
+                cls_bk._topo_vect_to_sub = topo_vect_to_sub
+                self.backend._topo_vect_to_sub = topo_vect_to_sub
 
                 new_grid_objects_types = cls_bk.grid_objects_types
                 new_grid_objects_types = new_grid_objects_types[new_grid_objects_types[:, cls_bk.STORAGE_COL] == -1,:]
-                cls_bk.grid_objects_types = 1 * new_grid_objects_types
-                self.backend.grid_objects_types = 1 * new_grid_objects_types
+                cls_bk.grid_objects_types = new_grid_objects_types.copy()
+                self.backend.grid_objects_types = new_grid_objects_types.copy()
 
                 # erase all trace of storage units
                 cls_bk.set_no_storage()
@@ -427,7 +466,7 @@ class Environment(BaseEnv):
 
                 # and recomputes everything while making sure everything is consistent
                 self.backend.assert_grid_correct()
-                type(self.backend)._topo_vect_to_sub = np.repeat(np.arange(cls_bk.n_sub), repeats=cls_bk.sub_info)
+                type(self.backend)._topo_vect_to_sub = topo_vect_to_sub
                 type(self.backend).grid_objects_types = new_grid_objects_types
 
     def _voltage_control(self, agent_action, prod_v_chronics):
@@ -511,6 +550,32 @@ class Environment(BaseEnv):
 
         self.chronics_handler.set_chunk_size(new_chunk_size)
 
+    def _check_validated(self, fun_name):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Make sure the checks postponed with `_validate_at_init=False` have been performed.
+        """
+        if not self._validate_at_init and not self._backend_checked_after_pf:
+            raise EnvError(f"Impossible to call `env.{fun_name}(...)` on this environment: it has been created with "
+                           f"\"_validate_at_init=False\" and the checks of the backend are postponed to the first "
+                           f"call to `env.reset()`. Please call `env.reset()` first.")
+
+    def step(self, action):
+        """
+        See :func:`grid2op.Environment.BaseEnv.step`
+
+        Raises
+        ------
+        :class:`grid2op.Exceptions.EnvError`
+            If the environment has been created with `_validate_at_init=False` and has not been reset yet.
+
+        """
+        self._check_validated("step")
+        return super().step(action)
+
     def simulate(self, action):
         """
         Another method to call `obs.simulate` to ensure compatibility between multi environment and
@@ -531,6 +596,7 @@ class Environment(BaseEnv):
         Prefer using `obs.simulate` if possible, it will be faster than this function.
 
         """
+        self._check_validated("simulate")
         return self.get_obs().simulate(action)
 
     def set_id(self, id_):
@@ -679,18 +745,27 @@ class Environment(BaseEnv):
 
         """
         self.backend.reset(self._init_grid_path)  # the real powergrid of the environment
-        self.backend.assert_grid_correct()
+        # no need to call `assert_grid_correct` again: the structure of the grid is fixed after `_init_backend`
 
         if self._thermal_limit_a is not None:
-            self.backend.set_thermal_limit(self._thermal_limit_a.astype(dt_float))
+            self.backend.set_thermal_limit(self._thermal_limit_a.astype(dt_float, copy=False))
 
         self._backend_action = self._backend_action_class()
         do_nothing = self._helper_action_env({})
-        *_, fail_to_start, info = self.step(do_nothing)
+        if self._backend_checked_after_pf:
+            *_, fail_to_start, info = self.step(do_nothing)
+        else:
+            # environment created with "_validate_at_init=False": this is the postponed initial step, that
+            # `self.step` would refuse to perform
+            *_, fail_to_start, info = super().step(do_nothing)
         if fail_to_start:
             raise Grid2OpException("Impossible to initialize the powergrid, the powerflow diverge at iteration 0. "
                                    "Available information are: {}".format(info))
 
+        if not self._backend_checked_after_pf:
+            self.backend.assert_grid_correct_after_powerflow()
+            self._backend_checked_after_pf = True
+
     def add_text_logger(self, logger=None):
         """
         Add a text logger to this  :class:`Environment`
@@ -809,7 +884,11 @@ class Environment(BaseEnv):
         # First time show for human mode
         if self.viewer_fig is None and mode == "human":
             fig.show()
-        else: # Update the figure content
+        elif mode == "human":  # Update the figure content
+            # let the GUI event loop redraw the figure when it is idle
+            fig.canvas.draw_idle()
+        else:
+            # the image is needed right now
             fig.canvas.draw()
 
         # Store to re-use the figure
@@ -817,18 +896,21 @@ class Environment(BaseEnv):
         # Return the figure in case it needs to be saved/used
         return self.viewer_fig
 
-    def _custom_deepcopy_for_copy(self, new_obj):
-        super()._custom_deepcopy_for_copy(new_obj)
+    def _custom_deepcopy_for_copy(self, new_obj, dict_=None):
+        super()._custom_deepcopy_for_copy(new_obj, dict_=dict_)
 
         new_obj.name = self.name
         new_obj._read_from_local_dir = self._read_from_local_dir
         new_obj.metadata = copy.deepcopy(self.metadata)
-        new_obj.spec = copy.deepcopy(self.spec)
+        # "spec" (None or a gym EnvSpec) only holds metadata that is never modified
+        new_obj.spec = copy.copy(self.spec)
 
         new_obj._raw_backend_class = self._raw_backend_class
         new_obj._compat_glop_version = self._compat_glop_version
         new_obj._actionClass_orig = self._actionClass_orig
         new_obj._observationClass_orig = self._observationClass_orig
+        new_obj._validate_at_init = self._validate_at_init
+        new_obj._backend_checked_after_pf = self._backend_checked_after_pf
 
     def copy(self):
         """
@@ -856,6 +938,63 @@ class Environment(BaseEnv):
         self._custom_deepcopy_for_copy(res)
         return res
 
+    def __deepcopy__(self, memodict={}):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Make sure `copy.deepcopy(env)` relies on :func:`Environment.copy` instead of the (much slower) generic
+        deep copy of every attribute.
+        """
+        res = self.copy()
+        memodict[id(self)] = res
+        return res
+
+    @classmethod
+    def _fast_clone(cls, template, chronics_handler=None):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Create an environment from an already initialized and validated `template` environment.
+
+        Contrary to building a new environment from :func:`Environment.get_kwargs`, this does not read the grid
+        (nor the redispatching, storage or layout data) from the hard drive and does not perform the initial
+        "do nothing" step: all the classes (action, observation, action spaces etc.) of the template
+        are re-used as is. Only the backend (copied) and, if provided, the chronics handler are re-bound.
+
+        It is used by the :class:`grid2op.Runner.Runner` to create the environments of the episodes played by
+        the same process.
+
+        Parameters
+        ----------
+        template: :class:`Environment`
+            The environment to clone
+
+        chronics_handler: :class:`grid2op.Chronics.ChronicsHandler`
+            The chronics handler to use in the clone. If ``None`` a copy of the one of the template is used.
+
+        Returns
+        -------
+        res: :class:`Environment`
+            The clone. It is in the same state as the template, you need to call `reset` before using it
+            (especially if a new `chronics_handler` was provided).
+
+        """
+        if not isinstance(template, cls):
+            raise EnvError(f"Impossible to clone an environment of type \"{type(template)}\" into a \"{cls}\"")
+        my_cls = type(template)
+        res = my_cls.__new__(my_cls)
+        if chronics_handler is None:
+            template._custom_deepcopy_for_copy(res)
+        else:
+            # the chronics handler of the template is not copied: it would be replaced right after
+            template._custom_deepcopy_for_copy(res, dict_={"chronics_handler": chronics_handler})
+            res._init_chronics_handler(chronics_handler, res._names_chronics_to_backend)
+        return res
+
     def get_kwargs(self, with_backend=True):
         """
         This function allows to make another Environment with the same parameters as the one that have been used
@@ -925,6 +1064,7 @@ class Environment(BaseEnv):
         res["kwargs_attention_budget"] = copy.deepcopy(self._kwargs_attention_budget)
         res["has_attention_budget"] = self._has_attention_budget
         res["_read_from_local_dir"] = self._read_from_local_dir
+        res["_validate_at_init"] = self._validate_at_init
         return res
 
     def _chronics_folder_name(self):
@@ -1019,12 +1159,12 @@ class Environment(BaseEnv):
 
         """
         # define all the locations
-        if re.match(self.REGEX_SPLIT, add_for_train) is None:
+        if self.REGEX_SPLIT.match(add_for_train) is None:
             raise EnvError(f"The suffixes you can use for training data (add_for_train) "
-                           f"should match the regex \"{self.REGEX_SPLIT}\"")
-        if re.match(self.REGEX_SPLIT, add_for_val) is None:
+                           f"should match the regex \"{self.REGEX_SPLIT.pattern}\"")
+        if self.REGEX_SPLIT.match(add_for_val) is None:
             raise EnvError(f"The suffixes you can use for validation data (add_for_val)"
-                           f"should match the regex \"{self.REGEX_SPLIT}\"")
+                           f"should match the regex \"{self.REGEX_SPLIT.pattern}\"")
 
         from grid2op.Chronics import MultifolderWithCache, Multifolder
         if not isinstance(self.chronics_handler.real_data, (MultifolderWithCache, Multifolder)):
@@ -1035,7 +1175,7 @@ class Environment(BaseEnv):
         path_train = os.path.split(my_path)
         my_name = path_train[1]
         if remove_from_name is not None:
-            if re.match(r"^[a-zA-Z0-9\\^\\$_]*$", remove_from_name) is None:
+            if self.REGEX_REMOVE_FROM_NAME.match(remove_from_name) is None:
                 raise EnvError("The suffixes you can remove from the name of the environment (remove_from_name)"
                                "should match the regex \"^[a-zA-Z0-9^$_]*$\"")
             my_name = re.sub(remove_from_name, "", my_name)
@@ -1069,25 +1209,58 @@ class Environment(BaseEnv):
         to_val = set(val_scen_id)
 
         # copy the files
-        for el in os.listdir(my_path):
-            tmp_path = os.path.join(my_path, el)
-            if os.path.isfile(tmp_path):
-                # this is a regular env file
-                os.symlink(tmp_path, os.path.join(path_train, el))
-                os.symlink(tmp_path, os.path.join(path_val, el))
-            elif os.path.isdir(tmp_path):
-                if el == chronics_dir:
-                    # this is the chronics folder
-                    os.mkdir(os.path.join(path_train, chronics_dir))
-                    os.mkdir(os.path.join(path_val, chronics_dir))
-                    for chron_name in all_chron:
-                        tmp_path_chron = os.path.join(tmp_path, chron_name)
-                        if chron_name in to_val:
-                            os.symlink(tmp_path_chron, os.path.join(path_val, chronics_dir, chron_name))
-                        else:
-                            os.symlink(tmp_path_chron, os.path.join(path_train, chronics_dir, chron_name))
+        with os.scandir(my_path) as entries:
+            for entry in entries:
+                el = entry.name
+                tmp_path = entry.path
+                if entry.is_file():
+                    # this is a regular env file
+                    os.symlink(tmp_path, os.path.join(path_train, el))
+                    os.symlink(tmp_path, os.path.join(path_val, el))
+                elif entry.is_dir():
+                    if el == chronics_dir:
+                        # this is the chronics folder
+                        path_train_chron = os.path.join(path_train, chronics_dir)
+                        path_val_chron = os.path.join(path_val, chronics_dir)
+                        os.mkdir(path_train_chron)
+                        os.mkdir(path_val_chron)
+                        self._symlink_chronics(tmp_path, all_chron, to_val, path_train_chron, path_val_chron)
         return nm_train, nm_val
 
+    @staticmethod
+    def _symlink_chronics(chronics_path, all_chron, to_val, path_train_chron, path_val_chron):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Create, for each chronics in `all_chron`, a symbolic link in `path_val_chron` (if it is in `to_val`)
+        or in `path_train_chron` (otherwise).
+
+        When the platform supports it, the links are created relative to the (opened once) destination folders,
+        instead of resolving the full destination path for each chronics.
+        """
+        if os.symlink not in os.supports_dir_fd:
+            for chron_name in all_chron:
+                tmp_path_chron = os.path.join(chronics_path, chron_name)
+                if chron_name in to_val:
+                    os.symlink(tmp_path_chron, os.path.join(path_val_chron, chron_name))
+                else:
+                    os.symlink(tmp_path_chron, os.path.join(path_train_chron, chron_name))
+            return
+
+        fd_train = os.open(path_train_chron, os.O_RDONLY)
+        try:
+            fd_val = os.open(path_val_chron, os.O_RDONLY)
+            try:
+                for chron_name in all_chron:
+                    tmp_path_chron = os.path.join(chronics_path, chron_name)
+                    os.symlink(tmp_path_chron, chron_name, dir_fd=fd_val if chron_name in to_val else fd_train)
+            finally:
+                os.close(fd_val)
+        finally:
+            os.close(fd_train)
+
     def train_val_split_random(self,
                                pct_val=10.,
                                add_for_train="train",
@@ -1175,18 +1348,24 @@ class Environment(BaseEnv):
         This function will fail if an environment already exists with one of the name that would be given
         to the training environment or the validation environment.
 
+        The chronics of the validation set are drawn (with the random generator of the environment,
+        see :func:`Environment.seed`) without replacement: the validation set counts exactly
+        `int(nb_chronics * pct_val / 100.)` different chronics. Before grid2op 1.6.4 they were drawn with replacement,
+        so the same seed does not give the same split as in these versions.
+
         """
-        if re.match(self.REGEX_SPLIT, add_for_train) is None:
+        if self.REGEX_SPLIT.match(add_for_train) is None:
             raise EnvError("The suffixes you can use for training data (add_for_train) "
-                           "should match the regex \"{self.REGEX_SPLIT}\"")
-        if re.match(self.REGEX_SPLIT, add_for_val) is None:
+                           f"should match the regex \"{self.REGEX_SPLIT.pattern}\"")
+        if self.REGEX_SPLIT.match(add_for_val) is None:
             raise EnvError("The suffixes you can use for validation data (add_for_val)"
-                           "should match the regex \"{self.REGEX_SPLIT}\"")
+                           f"should match the regex \"{self.REGEX_SPLIT.pattern}\"")
 
         my_path = self.get_path_env()
         chronics_path = os.path.join(my_path, self._chronics_folder_name())
+        # sorted so that the split only depends on the seed, and not on the order of the file system
         all_chron = sorted(os.listdir(chronics_path))
-        to_val = self.space_prng.choice(all_chron, int(len(all_chron) * pct_val * 0.01))
+        to_val = self.space_prng.choice(all_chron, int(len(all_chron) * pct_val * 0.01), replace=False)
         return self.train_val_split(to_val,
                                     add_for_train=add_for_train,
                                     add_for_val=add_for_val,
@@ -710,6 +710,20 @@ class BaseObservation(GridObjects):
         Reset the :class:`BaseObservation` to a blank state, where everything is set to either ``None`` or to its default
         value.
 
+        """
+        self._reset_topo_and_flows()
+        self._reset_calendar()
+        self._reset_others()
+
+    def _reset_topo_and_flows(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Part of :func:`BaseObservation.reset` that resets the topology, the injections, the flows and the
+        cooldowns, that are usually all read back from the backend / the environment in `update`.
+
         """
         # 0. (line is disconnected) / 1. (line is connected)
         self.line_status[:] = True
@@ -741,11 +755,17 @@ class BaseObservation(GridObjects):
         # cool down and reconnection time after hard overflow, soft overflow or cascading failure
         self.time_before_cooldown_line[:] = -1
         self.time_before_cooldown_sub[:] = -1
-        self.time_next_maintenance[:] = -1
-        self.duration_next_maintenance[:] = -1
         self.timestep_overflow[:] = 0
 
-        # calendar data
+    def _reset_calendar(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Part of :func:`BaseObservation.reset` that resets the calendar data.
+
+        """
         self.year = dt_int(1970)
         self.month = dt_int(0)
         self.day = dt_int(0)
@@ -753,6 +773,20 @@ class BaseObservation(GridObjects):
         self.minute_of_hour = dt_int(0)
         self.day_of_week = dt_int(0)
 
+    def _reset_others(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Part of :func:`BaseObservation.reset` that resets everything not handled by
+        :func:`BaseObservation._reset_topo_and_flows` and :func:`BaseObservation._reset_calendar`
+        (maintenance, forecasts, redispatching, storage units, shunts, theta, alarm feature...)
+
+        """
+        self.time_next_maintenance[:] = -1
+        self.duration_next_maintenance[:] = -1
+
         # forecasts
         self._forecasted_inj = []
         self._forecasted_grid_act = {}
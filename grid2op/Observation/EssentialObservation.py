@@ -143,19 +143,21 @@ class EssentialObservation(BaseObservation):
     def update(self, env, with_forecast=False):
         # reset the matrices
         self._reset_matrices()
-        self.reset()
+        # topology, flows and calendar are overwritten below
+        self._reset_others()
 
         # counter
         self.current_step = env.nb_time_step
         self.max_step = env.max_episode_duration()
 
         # extract the time stamps
-        self.year = dt_int(env.time_stamp.year)
-        self.month = dt_int(env.time_stamp.month)
-        self.day = dt_int(env.time_stamp.day)
-        self.hour_of_day = dt_int(env.time_stamp.hour)
-        self.minute_of_hour = dt_int(env.time_stamp.minute)
-        self.day_of_week = dt_int(env.time_stamp.weekday())
+        time_stamp = env.time_stamp
+        self.year = dt_int(time_stamp.year)
+        self.month = dt_int(time_stamp.month)
+        self.day = dt_int(time_stamp.day)
+        self.hour_of_day = dt_int(time_stamp.hour)
+        self.minute_of_hour = dt_int(time_stamp.minute)
+        self.day_of_week = dt_int(time_stamp.weekday())
         
         # get the values related to topology
         self.timestep_overflow[:] = env._timestep_overflow
@@ -164,19 +166,19 @@ class EssentialObservation(BaseObservation):
 
 
         # get the values related to continuous values
-        self.gen_p[:], self.gen_q[:], self.gen_v[:] = env.backend.generators_info()
-        self.load_p[:], self.load_q[:], self.load_v[:] = env.backend.loads_info()
-        self.p_or[:], self.q_or[:], self.v_or[:], self.a_or[:] = env.backend.lines_or_info()
-        self.p_ex[:], self.q_ex[:], self.v_ex[:], self.a_ex[:] = env.backend.lines_ex_info()
+        env.backend.generators_info_into(self.gen_p, self.gen_q, self.gen_v)
+        env.backend.loads_info_into(self.load_p, self.load_q, self.load_v)
+        env.backend.lines_or_info_into(self.p_or, self.q_or, self.v_or, self.a_or)
+        env.backend.lines_ex_info_into(self.p_ex, self.q_ex, self.v_ex, self.a_ex)
 
         # handles forecasts here
         if with_forecast:
             inj_action = {}
             dict_ = {}
-            dict_["load_p"] = dt_float(1.0 * self.load_p)
-            dict_["load_q"] = dt_float(1.0 * self.load_q)
-            dict_["prod_p"] = dt_float(1.0 * self.gen_p)
-            dict_["prod_v"] = dt_float(1.0 * self.gen_v)
+            dict_["load_p"] = self.load_p.astype(dt_float)
+            dict_["load_q"] = self.load_q.astype(dt_float)
+            dict_["prod_p"] = self.gen_p.astype(dt_float)
+            dict_["prod_v"] = self.gen_v.astype(dt_float)
             inj_action["injection"] = dict_
             # inj_action = self.action_helper(inj_action)
             timestamp = self.get_time_stamp()
@@ -184,7 +186,7 @@ class EssentialObservation(BaseObservation):
             self._forecasted_inj += env.chronics_handler.forecasts()
             self._forecasted_grid = [None for _ in self._forecasted_inj]
 
-        self.rho[:] = env.backend.get_relative_flow().astype(dt_float)
+        self.rho[:] = env.backend.get_relative_flow()
 
         # cool down and reconnection time after hard overflow, soft overflow or cascading failure
         self.time_before_cooldown_line[:] = env._times_before_line_status_actionable
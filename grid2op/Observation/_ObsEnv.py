@@ -157,7 +157,7 @@ class _ObsEnv(BaseEnv):
         # alarm / attention budget
         self._attention_budget_state_init = None
 
-        self._disc_lines = np.zeros(shape=self.n_line, dtype=dt_int) - 1
+        self._disc_lines = np.full(shape=self.n_line, fill_value=-1, dtype=dt_int)
         self._max_episode_duration = max_episode_duration
 
     def max_episode_duration(self):
@@ -516,7 +516,7 @@ class _ObsEnv(BaseEnv):
         if self._thermal_limit_a is None:
             self._thermal_limit_a = 1.0 * env._thermal_limit_a.astype(dt_float)
         else:
-            self._thermal_limit_a[:] = env._thermal_limit_a.astype(dt_float)
+            self._thermal_limit_a[:] = env._thermal_limit_a.astype(dt_float, copy=False)
         self.gen_activeprod_t_init[:] = env._gen_activeprod_t
         self.gen_activeprod_t_redisp_init[:] = env._gen_activeprod_t_redisp
         self.times_before_line_status_actionable_init[:] = env._times_before_line_status_actionable
@@ -61,7 +61,7 @@ class CombinedReward(BaseReward):
 
     def updateRewardWeight(self, reward_name, reward_weight):
         if reward_name in self.rewards:
-            self.rewards[reward_name]["weight"] = reward_weight
+            self.rewards[reward_name]["weight"] = dt_float(reward_weight)
             return True
         return False
 
@@ -93,7 +93,7 @@ class CombinedReward(BaseReward):
             # Call individual reward
             r = r_instance(action, env, has_error, is_done, is_illegal, is_ambiguous)
             # Sum by weighted result
-            w = dt_float(reward["weight"])
+            w = reward["weight"]  # already a dt_float, see addReward and updateRewardWeight
             res += dt_float(r) * w
         # Return total sum
         return res
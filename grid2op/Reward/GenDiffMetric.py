@@ -6,11 +6,9 @@
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
-from multiprocessing.sharedctypes import RawArray
 import numpy as np
 from grid2op.Reward.BaseReward import BaseReward
 from grid2op.dtypes import dt_float
-import networkx as nx
 
 
 class GenDiffMetric(BaseReward):
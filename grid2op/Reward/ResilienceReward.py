@@ -6,11 +6,13 @@
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
-from multiprocessing.sharedctypes import RawArray
 import numpy as np
 from grid2op.Reward.BaseReward import BaseReward
 from grid2op.dtypes import dt_float
-import networkx as nx
+
+# constants used at each step, built once
+_DTF_ZERO = dt_float(0.0)
+_DTF_ONE = dt_float(1.0)
 
 
 class ResilienceReward(BaseReward):
@@ -55,6 +57,7 @@ class ResilienceReward(BaseReward):
         self.reward_min = 0.0
         self.reward_illegal = -1.0
         self.reward_max = dt_float(env.backend.n_line)
+        self._n_line = env.backend.n_line
 
     def __call__(self, action, env, has_error, is_done, is_illegal, is_ambiguous):
         if has_error:
@@ -65,44 +68,30 @@ class ResilienceReward(BaseReward):
         
         # Get info from env
         obs = env.current_obs
-        n_line = obs.n_line
-        
-        n_sub = obs.n_sub
-        topo = obs.topo_vect
-        or_topo = obs.line_or_pos_topo_vect
-        ex_topo = obs.line_ex_pos_topo_vect
-        or_sub = obs.line_or_to_subid
-        ex_sub = obs.line_ex_to_subid
-        
-        conn_line = 0
+
+        # # only used by the graph computation below
+        # n_sub = obs.n_sub
+        # topo = obs.topo_vect
+        # or_topo = obs.line_or_pos_topo_vect
+        # ex_topo = obs.line_ex_pos_topo_vect
+        # or_sub = obs.line_or_to_subid
+        # ex_sub = obs.line_ex_to_subid
+
+        # number of connected powerlines
+        conn_line = int(np.count_nonzero(obs.line_status))
 
         # # Create a graph of vertices
         # # Use one vertex per substation per bus
-        # G = nx.Graph()
-        
-        # # Set lines edges for current bus
-        for line_idx in range(n_line):
-            # Skip if line is disconnected
-            if obs.line_status[line_idx] == False:
-                continue
-            # Get substation index for current line
-            conn_line += 1
-            # lor_sub = or_sub[line_idx]
-            # lex_sub = ex_sub[line_idx]
-            # # Get the buses for current line
-            # lor_bus = topo[or_topo[line_idx]]
-            # lex_bus = topo[ex_topo[line_idx]]
-
-            # if lor_bus <= 0 or lex_bus <= 0:
-            #     continue
-
-            # # Compute edge vertices indices for current graph
-            # left_v =  lor_sub + (lor_bus - 1) * n_sub
-            # right_v = lex_sub + (lex_bus - 1) * n_sub
-
-            # # Register edge in graph
-            # G.add_edge(left_v, right_v)
-            
+        # # only connected powerlines with both ends on a bus are edges of the graph
+        # lor_bus = topo[or_topo]
+        # lex_bus = topo[ex_topo]
+        # valid = obs.line_status & (lor_bus > 0) & (lex_bus > 0)
+        # # Compute edge vertices indices for all the lines at once
+        # left_v = or_sub[valid] + (lor_bus[valid] - 1) * n_sub
+        # right_v = ex_sub[valid] + (lex_bus[valid] - 1) * n_sub
+        # # (requires `import networkx as nx`)
+        # G = nx.from_edgelist(zip(left_v.tolist(), right_v.tolist()))
+
         # # Find the bridges
         # n_bridges = dt_float(len(list(nx.bridges(G))))
 
@@ -120,14 +109,15 @@ class ResilienceReward(BaseReward):
         # assert(gen_p.sum() > 0)
         # reward = bridge_penalty + power_sat_reward
 
-        # reward *= (conn_line / n_line)   # powerline integrity of the network
-        # assert(n_line > 0)
+        # reward *= (conn_line / self._n_line)   # powerline integrity of the network
+        # assert(self._n_line > 0)
         # # topological integrity of the network
-        # reward /= env.backend.get_num_islands()
-        # assert(env.backend.get_num_islands() > 0)
+        # num_islands = env.backend.get_num_islands()
+        # assert(num_islands > 0)
+        # reward /= num_islands
 
         # TESTING ZHIYAO'S REWARD FUNCTION
-        LC = (conn_line / n_line)
+        LC = (conn_line / self._n_line)
         actual_load = env.current_obs.load_p
 
         # load_diff_p = env._load_difference()
@@ -150,6 +140,6 @@ class ResilienceReward(BaseReward):
         thermal_limits += 1e-1  # for numerical stability
         relative_flow = np.divide(ampere_flows, thermal_limits, dtype=dt_float)
 
-        x = np.minimum(relative_flow, dt_float(1.0))
-        lines_capacity_usage_score = np.maximum(dt_float(1.0) - x ** 2, np.zeros(x.shape, dtype=dt_float))
+        x = np.minimum(relative_flow, _DTF_ONE)
+        lines_capacity_usage_score = np.maximum(_DTF_ONE - x ** 2, _DTF_ZERO)
         return lines_capacity_usage_score
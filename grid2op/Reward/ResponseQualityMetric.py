@@ -6,11 +6,9 @@
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
-from multiprocessing.sharedctypes import RawArray
 import numpy as np
 from grid2op.Reward.BaseReward import BaseReward
 from grid2op.dtypes import dt_float
-import networkx as nx
 
 
 class ResponseQualityMetric(BaseReward):
@@ -23,16 +21,10 @@ class ResponseQualityMetric(BaseReward):
             return -1
 
         # Get obs from env
-        obs = env.get_obs()
+        obs = env.current_obs
 
-        # All lines ids
-        lines_id = np.arange(env.n_line)
-        lines_id = lines_id[obs.time_before_cooldown_line == 0]
-
-        n_lines = dt_float(0.0)
-        for line_id in lines_id:
-            # Line could be reconnected but isn't
-            if obs.line_status[line_id] == False:
-                n_lines += dt_float(1.0)
+        # Lines that could be reconnected but aren't
+        can_be_reconnected = (obs.time_before_cooldown_line == 0) & (~obs.line_status)
+        n_lines = dt_float(np.count_nonzero(can_be_reconnected))
 
         return n_lines
\ No newline at end of file
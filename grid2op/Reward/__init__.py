@@ -31,7 +31,6 @@ __all__ = [
     "L2RPNSandBoxScore"
 ]
 
-from sympy import im
 from grid2op.Reward.ConstantReward import ConstantReward
 from grid2op.Reward.EconomicReward import EconomicReward
 from grid2op.Reward.FlatReward import FlatReward
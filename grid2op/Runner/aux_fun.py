@@ -32,27 +32,38 @@ def _aux_one_process_parrallel(runner,
     parameters = copy.deepcopy(runner.parameters)
     nb_episode_this_process = len(episode_this_process)
     res = [(None, None, None) for _ in range(nb_episode_this_process)]
-    for i, p_id in enumerate(episode_this_process):
-        env, agent = runner._new_env(chronics_handler=chronics_handler,
-                                     parameters=parameters)
-        try:
-            env_seed = None
-            if env_seeds is not None:
-                env_seed = env_seeds[i]
-            agt_seed = None
-            if agent_seeds is not None:
-                agt_seed = agent_seeds[i]
-            name_chron, cum_reward, nb_time_step, episode_data = _aux_run_one_episode(
-                env, agent, runner.logger, p_id, path_save, env_seed=env_seed, max_iter=max_iter, agent_seed=agt_seed,
-                detailed_output=add_detailed_output)
-            id_chron = chronics_handler.get_id()
-            max_ts = chronics_handler.max_timestep()
-            if add_detailed_output:
-                res[i] = (id_chron, name_chron, float(cum_reward), nb_time_step, max_ts, episode_data)
-            else:
-                res[i] = (id_chron, name_chron, float(cum_reward), nb_time_step, max_ts)
-        finally:
-            env.close()
+    template_env = None
+    if nb_episode_this_process > 1:
+        # all the environments of this process are the same: build the first one once, and
+        # clone it for each episode (which avoids reading the grid from the hard drive each time)
+        template_env = runner._build_env(chronics_handler=chronics_handler,
+                                         parameters=parameters)
+    try:
+        for i, p_id in enumerate(episode_this_process):
+            env, agent = runner._new_env(chronics_handler=chronics_handler,
+                                         parameters=parameters,
+                                         template_env=template_env)
+            try:
+                env_seed = None
+                if env_seeds is not None:
+                    env_seed = env_seeds[i]
+                agt_seed = None
+                if agent_seeds is not None:
+                    agt_seed = agent_seeds[i]
+                name_chron, cum_reward, nb_time_step, episode_data = _aux_run_one_episode(
+                    env, agent, runner.logger, p_id, path_save, env_seed=env_seed, max_iter=max_iter,
+                    agent_seed=agt_seed, detailed_output=add_detailed_output)
+                id_chron = chronics_handler.get_id()
+                max_ts = chronics_handler.max_timestep()
+                if add_detailed_output:
+                    res[i] = (id_chron, name_chron, float(cum_reward), nb_time_step, max_ts, episode_data)
+                else:
+                    res[i] = (id_chron, name_chron, float(cum_reward), nb_time_step, max_ts)
+            finally:
+                env.close()
+    finally:
+        if template_env is not None:
+            template_env.close()
     return res
 
 
@@ -9,7 +9,7 @@
 import os
 import warnings
 import copy
-from multiprocessing import Pool
+from multiprocessing import get_context
 
 from grid2op.Action import BaseAction, TopologyAction, DontAct
 from grid2op.Exceptions import UsedRunnerError, Grid2OpException, EnvError
@@ -254,7 +254,8 @@ class Runner(object):
                  kwargs_attention_budget=None,
                  has_attention_budget=False,
                  # experimental: whether to read from local dir or generate the classes on the fly:
-                 _read_from_local_dir=False
+                 _read_from_local_dir=False,
+                 mp_context=None,
                  ):
         """
         Initialize the Runner.
@@ -312,6 +313,11 @@ class Runner(object):
         voltagecontrolerClass: :class:`grid2op.VoltageControler.ControlVoltageFromFile`, optional
             The controler that will change the voltage setpoints of the generators.
 
+        mp_context: ``str``, optional
+            The start method ("fork", "spawn" or "forkserver") of the processes used by :func:`Runner.run` when
+            ``nb_process > 1``. By default (``None``) "fork" is used on linux (the child processes then inherit
+            the memory of the main process) and the default start method of the platform is used otherwise.
+
         # TODO documentation on the opponent
         # TOOD doc for the attention budget
         """
@@ -423,6 +429,7 @@ class Runner(object):
                                "and both are None.")
         self.agentInstance = agentInstance
 
+        self._mp_context = mp_context
         self._read_from_local_dir = _read_from_local_dir
 
         self.logger = ConsoleLog(
@@ -505,7 +512,7 @@ class Runner(object):
 
         self.__used = False
 
-    def _new_env(self, chronics_handler, parameters):
+    def _build_env(self, chronics_handler, parameters):
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore")
             res = self.envClass(init_grid_path=self.init_grid_path,
@@ -541,6 +548,15 @@ class Runner(object):
 
         if self.grid_layout is not None:
             res.attach_layout(self.grid_layout)
+        return res
+
+    def _new_env(self, chronics_handler, parameters, template_env=None):
+        if template_env is not None:
+            # the environment is cloned from an environment already built by this runner: the grid is not read
+            # again from the hard drive (and the thermal limits / layout are already set)
+            res = type(template_env)._fast_clone(template_env, chronics_handler=chronics_handler)
+        else:
+            res = self._build_env(chronics_handler, parameters)
 
         if self._useclass:
             agent = self.agentClass(res.action_space)
@@ -801,14 +817,21 @@ class Runner(object):
                 for i in range(nb_episode):
                     seeds_agt_res[i % nb_process].append(agent_seeds[i])
 
+            if self._mp_context is not None:
+                mp_context = get_context(self._mp_context)
+            elif _IS_LINUX:
+                mp_context = get_context("fork")
+            else:
+                mp_context = get_context()
+
             res = []
-            if _IS_LINUX:
-               lists = [(self, pn, i, path_save, seeds_res[i], max_iter, add_detailed_output)
+            if mp_context.get_start_method() == "fork":
+                lists = [(self, pn, i, path_save, seeds_res[i], max_iter, add_detailed_output)
                          for i, pn in enumerate(process_ids)]
             else:
                 lists = [(Runner(**self._get_params()), pn, i, path_save, seeds_res[i], max_iter, add_detailed_output)
                          for i, pn in enumerate(process_ids)]
-            with Pool(nb_process) as p:
+            with mp_context.Pool(nb_process) as p:
                 tmp = p.starmap(_aux_one_process_parrallel,
                                 lists)
             for el in tmp:
@@ -845,7 +868,8 @@ class Runner(object):
                "opponent_attack_cooldown": self.opponent_attack_cooldown,
                "opponent_kwargs": copy.deepcopy(self.opponent_kwargs),
                "grid_layout": copy.deepcopy(self.grid_layout),
-               "with_forecast": self.with_forecast
+               "with_forecast": self.with_forecast,
+               "mp_context": self._mp_context
         }
         return res
 
@@ -6,7 +6,6 @@
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
-import copy
 import warnings
 import numpy as np
 from gym.spaces import Box
@@ -115,6 +114,12 @@ class BoxGymActSpace(Box):
     And you can implement pretty much anything in the "from_gym" function.
 
     """
+    # how each part of the gym action is converted back to grid2op, see `_get_slices`
+    _CONVERT_FLOAT = 0
+    _CONVERT_INT = 1
+    _CONVERT_BOOL = 2
+    _CONVERT_FUNC = 3
+
     def __init__(self,
                  grid2op_action_space,
                  attr_to_keep=ALL_ATTR,
@@ -143,16 +148,18 @@ class BoxGymActSpace(Box):
         self._attr_to_keep = sorted(attr_to_keep)
 
         act_sp = grid2op_action_space
-        self._act_space = copy.deepcopy(grid2op_action_space)
+        # only used to build new actions, there is no need to copy it
+        self._act_space = grid2op_action_space
 
+        not_disp = ~act_sp.gen_redispatchable
+        not_renew = ~act_sp.gen_renewable
         low_gen = -1.0 * act_sp.gen_max_ramp_down
         high_gen = 1.0 * act_sp.gen_max_ramp_up
-        low_gen[~act_sp.gen_redispatchable] = 0.
-        high_gen[~act_sp.gen_redispatchable] = 0.
+        low_gen[not_disp] = 0.
+        high_gen[not_disp] = 0.
         curtail = np.full(shape=(act_sp.n_gen,), fill_value=0., dtype=dt_float)
-        curtail[~act_sp.gen_renewable] = 1.0
-        curtail_mw = np.full(shape=(act_sp.n_gen,), fill_value=0., dtype=dt_float)
-        curtail_mw[~act_sp.gen_renewable] = act_sp.gen_pmax[~act_sp.gen_renewable]
+        curtail[not_renew] = 1.0
+        curtail_mw = np.where(not_renew, act_sp.gen_pmax, 0.).astype(dt_float, copy=False)
         self.dict_properties = {
             "set_line_status": (np.full(shape=(act_sp.n_line,), fill_value=-1, dtype=dt_int),
                                 np.full(shape=(act_sp.n_line,), fill_value=1, dtype=dt_int),
@@ -214,9 +221,11 @@ class BoxGymActSpace(Box):
 
         self._dims = None
         self._dtypes = None
+        self._slices = None
         if functs is None:
             functs = {}
         low, high, shape, dtype = self._get_info(functs)
+        self._slices = self._get_slices()
 
         # initialize the base container
         Box.__init__(self, low=low, high=high, shape=shape, dtype=dtype)
@@ -228,6 +237,8 @@ class BoxGymActSpace(Box):
         dtype = None
         self._dims = []
         self._dtypes = []
+        # low / high of each attribute, with the dtype of the box at the time the attribute is processed
+        all_low_high = []
         for el in self._attr_to_keep:
             if el in functs:
                 # the attribute name "el" has been put in the functs
@@ -252,9 +263,10 @@ class BoxGymActSpace(Box):
                 # simulate a vector in the range low_, high_ and the right shape to test the function given
                 # by the user
                 vect_right_properties = np.random.uniform(size=shape_)
-                finite_both = np.isfinite(low_) & np.isfinite(high_)
-                fintte_low = np.isfinite(low_) & ~np.isfinite(high_)
-                fintte_high = ~np.isfinite(low_) & np.isfinite(high_)
+                isfinite_low = np.isfinite(low_)
+                isfinite_high = np.isfinite(high_)
+                finite_both = isfinite_low & isfinite_high
+                fintte_high = ~isfinite_low & isfinite_high
                 vect_right_properties[finite_both] = vect_right_properties[finite_both] * \
                                                      (high_[finite_both] - low_[finite_both]) + \
                                                      low_[finite_both]
@@ -301,52 +313,98 @@ class BoxGymActSpace(Box):
                 high_ -= self._add[el]
             if el in self._multiply:
                 # special case if a 0 were entered
-                arr_ = 1.0 * self._multiply[el]
+                arr_ = np.asarray(self._multiply[el])
                 is_nzero = arr_ != 0.
                 low_[is_nzero] /= arr_[is_nzero]
                 high_[is_nzero] /= arr_[is_nzero]
 
             # "fix" the low / high : they can be inverted if self._multiply < 0. for example
-            tmp_l = copy.deepcopy(low_)
-            tmp_h = copy.deepcopy(high_)
-            low_ = np.minimum(tmp_h, tmp_l)
-            high_ = np.maximum(tmp_h, tmp_l)
-
-            if low is None:
-                low = low_
-                high = high_
-            else:
-                low = np.concatenate((low.astype(dtype), low_.astype(dtype))).astype(dtype)
-                high = np.concatenate((high.astype(dtype), high_.astype(dtype))).astype(dtype)
+            if np.any(low_ > high_):
+                low_, high_ = np.minimum(high_, low_), np.maximum(high_, low_)
+            all_low_high.append((low_, high_, dtype))
 
             # remember where this need to be stored
             self._dims.append(shape[0])
             self._dtypes.append(dtype_)
 
+        if shape is not None:
+            # allocate low / high once and fill them attribute by attribute
+            low = np.empty(shape, dtype=dtype)
+            high = np.empty(shape, dtype=dtype)
+            prev = 0
+            for (low_, high_, dtype_tmp), where_to_put in zip(all_low_high, self._dims):
+                low[prev:where_to_put] = low_.astype(dtype_tmp, copy=False)
+                high[prev:where_to_put] = high_.astype(dtype_tmp, copy=False)
+                prev = where_to_put
         return low, high, shape, dtype
 
-    def _handle_attribute(self, res, gym_act_this, attr_nm):
+    def _get_slices(self):
         """
         INTERNAL
 
-        TODO
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
 
-        Parameters
-        ----------
-        res
-        gym_act_this
-        attr_nm
+        Compute once, for each attribute kept, where it is stored in the gym action and how it needs
+        to be converted to grid2op, so that :func:`BoxGymActSpace.from_gym` does not have to do it at each call.
 
         Returns
         -------
+        res: ``tuple``
+            One tuple `(start, stop, attr_nm, dtype, conversion, multiply, add)` per attribute, in the order of
+            the gym action. `multiply` and `add` are ``None`` if the attribute is not scaled. Attributes of
+            size 0 (that are not computed with a function) are skipped.
+        """
+        res = []
+        prev = 0
+        for attr_nm, where_to_put, dtype in zip(self._attr_to_keep, self._dims, self._dtypes):
+            if attr_nm in self.__func:
+                conversion = self._CONVERT_FUNC
+            elif not hasattr(self._act_space.actionClass, attr_nm):
+                raise RuntimeError(f"Unknown attribute \"{attr_nm}\".")
+            elif where_to_put == prev:
+                # nothing to update for this attribute (for example no storage units on the grid)
+                continue
+            else:
+                glop_dtype = self._key_dict_to_proptype.get(attr_nm)
+                if glop_dtype == dt_int:
+                    conversion = self._CONVERT_INT
+                elif glop_dtype == dt_bool:
+                    conversion = self._CONVERT_BOOL
+                else:
+                    conversion = self._CONVERT_FLOAT
+            res.append((prev, where_to_put, attr_nm, dtype, conversion,
+                        self._multiply.get(attr_nm), self._add.get(attr_nm)))
+            prev = where_to_put
+        return tuple(res)
 
+    def _convert_part(self, this_part, dtype, conversion, multiply, add):
         """
-        if attr_nm in self._multiply:
-            gym_act_this *= self._multiply[attr_nm]
-        if attr_nm in self._add:
-            gym_act_this += self._add[attr_nm]
-        setattr(res, attr_nm, gym_act_this)
-        return res
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Convert the part of the gym action(s) corresponding to one attribute to the values
+        given to the grid2op action. It works the same way for a single gym action or for a batch
+        of them (one per row), see :func:`BoxGymActSpace.from_gym_batch`.
+
+        The arguments (except `this_part`) are the ones precomputed in :func:`BoxGymActSpace._get_slices`.
+        """
+        if conversion == self._CONVERT_INT:
+            # convert floating point actions to integer.
+            # NB: i round first otherwise it is cut.
+            this_part = np.rint(this_part).astype(dtype)
+        elif conversion == self._CONVERT_BOOL:
+            # convert floating point actions to bool.
+            # NB: it's important here the numbers are between 0 and 1
+            this_part = (this_part >= 0.5).astype(dt_bool, copy=False)
+        if multiply is not None or add is not None:
+            # glop = gym * multiply + add, the gym action itself must not be modified
+            out = np.empty_like(this_part) if conversion == self._CONVERT_FLOAT else this_part
+            if multiply is not None:
+                this_part = np.multiply(this_part, multiply, out=out)
+            if add is not None:
+                this_part = np.add(this_part, add, out=out)
+        return this_part
 
     def from_gym(self, gym_act):
         """
@@ -366,26 +424,62 @@ class BoxGymActSpace(Box):
 
         """
         res = self._act_space()
-        prev = 0
-        for attr_nm, where_to_put, dtype in zip(self._attr_to_keep, self._dims, self._dtypes):
-            this_part = 1 * gym_act[prev:where_to_put]
-            if attr_nm in self.__func:
-                glop_act_tmp = self.__func[attr_nm](this_part)
+        for prev, where_to_put, attr_nm, dtype, conversion, multiply, add in self._slices:
+            this_part = gym_act[prev:where_to_put]
+            if conversion == self._CONVERT_FUNC:
+                # the user function gets its own copy of the gym action
+                glop_act_tmp = self.__func[attr_nm](1 * this_part)
                 res += glop_act_tmp
-            elif hasattr(res, attr_nm):
-                glop_dtype = self._key_dict_to_proptype[attr_nm]
-                if glop_dtype == dt_int:
-                    # convert floating point actions to integer.
-                    # NB: i round first otherwise it is cut.
-                    this_part = np.round(this_part, 0).astype(dtype)
-                elif glop_dtype == dt_bool:
-                    # convert floating point actions to bool.
-                    # NB: it's important here the numbers are between 0 and 1
-                    this_part = (this_part >= 0.5).astype(dt_bool)
-                if this_part.shape and this_part.shape[0]:
-                    # only update the attribute if there is actually something to update
-                    self._handle_attribute(res, this_part, attr_nm)
             else:
-                raise RuntimeError(f"Unknown attribute \"{attr_nm}\".")
-            prev = where_to_put
+                this_part = self._convert_part(this_part, dtype, conversion, multiply, add)
+                setattr(res, attr_nm, this_part)
+        return res
+
+    def from_gym_batch(self, gym_acts):
+        """
+        Same as :func:`BoxGymActSpace.from_gym` but for a batch of gym actions, for example the
+        actions of some vectorized environments.
+
+        The conversion (rounding, scaling etc.) of each attribute is performed once for the whole batch,
+        only the grid2op actions are then built one by one.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import numpy as np
+            import grid2op
+            from grid2op.gym_compat import BoxGymActSpace
+            env_name = "l2rpn_case14_sandbox"  # or any other name
+            env = grid2op.make(env_name)
+            gym_act_space = BoxGymActSpace(env.action_space, attr_to_keep=["redispatch"])
+
+            gym_acts = np.stack([gym_act_space.sample() for _ in range(8)])
+            grid2op_acts = gym_act_space.from_gym_batch(gym_acts)
+            # grid2op_acts[i] is the same as gym_act_space.from_gym(gym_acts[i])
+
+        Parameters
+        ----------
+        gym_acts: ``numpy.ndarray``
+            the gym actions, one per row (shape `(batch_size, dim)`)
+
+        Returns
+        -------
+        grid2op_acts: ``list``
+            The corresponding grid2op actions (:class:`grid2op.Action.BaseAction`), in the same order
+            as the rows of `gym_acts`
+
+        """
+        res = [self._act_space() for _ in range(gym_acts.shape[0])]
+        for prev, where_to_put, attr_nm, dtype, conversion, multiply, add in self._slices:
+            this_part = gym_acts[:, prev:where_to_put]
+            if conversion == self._CONVERT_FUNC:
+                for act_id, this_row in enumerate(this_part):
+                    # the user function gets its own copy of the gym action
+                    res[act_id] += self.__func[attr_nm](1 * this_row)
+            else:
+                this_part = self._convert_part(this_part, dtype, conversion, multiply, add)
+                for act, this_row in zip(res, this_part):
+                    setattr(act, attr_nm, this_row)
         return res
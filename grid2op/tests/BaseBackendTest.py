@@ -346,6 +346,19 @@ class BaseTestLoadingBackendFunc(MakeBackend):
         p_or_orig, q_or_orig, *_ = self.backend.lines_or_info()
         assert self.compare_vect(q_or_orig, true_values_ac)
 
+    def test_info_into(self):
+        self.skip_if_needed()
+        self.backend.runpf(is_dc=False)
+        for meth_nm, size in [("generators_info", self.backend.n_gen),
+                              ("loads_info", self.backend.n_load),
+                              ("lines_or_info", self.backend.n_line),
+                              ("lines_ex_info", self.backend.n_line)]:
+            res = getattr(self.backend, meth_nm)()
+            res_into = [np.full(size, fill_value=np.NaN, dtype=dt_float) for _ in res]
+            getattr(self.backend, f"{meth_nm}_into")(*res_into)
+            for el, el_into in zip(res, res_into):
+                assert self.compare_vect(el, el_into), f"error for {meth_nm}"
+
     def test_pf_ac_dc(self):
         self.skip_if_needed()
         true_values_ac = np.array([-20.40429168, 3.85499114, 4.2191378, 3.61000624,
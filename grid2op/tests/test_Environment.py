@@ -807,5 +807,48 @@ class TestMaxIter(unittest.TestCase):
             self.env.set_max_iter(0)
 
 
+class TestValidateAtInit(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env_ref = make("rte_case5_example", test=True)
+            self.env = Environment(**self.env_ref.get_kwargs())
+            kwargs = self.env_ref.get_kwargs()
+            kwargs["_validate_at_init"] = False
+            self.env_lazy = Environment(**kwargs)
+
+    def tearDown(self) -> None:
+        self.env_ref.close()
+        self.env.close()
+        self.env_lazy.close()
+
+    def test_no_step_at_init(self):
+        assert self.env.current_obs is not None
+        assert self.env._backend_checked_after_pf
+        assert self.env_lazy.current_obs is None
+        assert not self.env_lazy._backend_checked_after_pf
+
+    def test_same_after_reset(self):
+        obs = self.env.reset()
+        obs_lazy = self.env_lazy.reset()
+        assert self.env_lazy._backend_checked_after_pf
+        assert np.array_equal(obs.to_vect(), obs_lazy.to_vect())
+        obs, *_ = self.env.step(self.env.action_space())
+        obs_lazy, *_ = self.env_lazy.step(self.env_lazy.action_space())
+        assert np.array_equal(obs.to_vect(), obs_lazy.to_vect())
+
+    def test_get_kwargs(self):
+        assert self.env_lazy.get_kwargs()["_validate_at_init"] is False
+
+    def test_raise_before_reset(self):
+        with self.assertRaises(EnvError):
+            self.env_lazy.step(self.env_lazy.action_space())
+        with self.assertRaises(EnvError):
+            self.env_lazy.simulate(self.env_lazy.action_space())
+        self.env_lazy.reset()
+        *_, done, _ = self.env_lazy.step(self.env_lazy.action_space())
+        assert not done
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -121,5 +121,46 @@ class TestAgentCopy(TestAgent):
         self.env = self.env.copy()
 
 
+class TestLoadingBackendPandaPowerFastClone(TestLoadingBackendPandaPower):
+    def setUp(self):
+        super().setUp()
+        self.env_orig = self.env
+        self.env = type(self.env)._fast_clone(self.env)
+
+
+class TestResetOkFastClone(TestResetOk):
+    def setUp(self):
+        super().setUp()
+        self.env_orig = self.env
+        self.env = type(self.env)._fast_clone(self.env,
+                                               chronics_handler=copy.deepcopy(self.env.chronics_handler))
+        self.env.reset()
+
+
+class TestDeepCopy(unittest.TestCase):
+    """test that `copy.deepcopy(env)` gives an environment that behaves like the original one"""
+    def setUp(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make("rte_case5_example", test=True, reward_class=L2RPNReward,
+                            other_rewards={"test": L2RPNReward})
+
+    def tearDown(self):
+        self.env.close()
+
+    def test_deepcopy(self):
+        for i in range(5):
+            obs, reward, done, info = self.env.step(self.env.action_space())
+        env2 = copy.deepcopy(self.env)
+        assert type(env2) == type(self.env)
+        assert env2.backend is not self.env.backend
+        assert env2.get_obs() == obs
+
+        obs0, reward0, done0, info0 = self.env.step(self.env.action_space())
+        obs1, reward1, done1, info1 = env2.step(env2.action_space())
+        assert obs0 == obs1
+        assert reward0 == reward1
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -100,6 +100,34 @@ class TestRunner(HelperTests):
             assert int(timestep) == self.max_iter
             assert np.abs(cum_reward - self.real_reward) <= self.tol_one
 
+    def test_3episode_2process(self):
+        """one of the process plays 2 episodes: its environments are cloned from a template"""
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            res = self.runner._run_parrallel(nb_episode=3,
+                                             nb_process=2,
+                                             max_iter=self.max_iter)
+        assert len(res) == 3
+        for i, _, cum_reward, timestep, total_ts in res:
+            assert int(timestep) == self.max_iter
+            assert np.abs(cum_reward - self.real_reward) <= self.tol_one
+
+    def test_2episode_2process_mp_context(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            with make("rte_case5_example", test=True) as env:
+                runner = Runner(**env.get_params_for_runner(), mp_context="fork")
+                res = runner.run(nb_episode=2,
+                                 nb_process=2,
+                                 max_iter=self.max_iter)
+                res_seq = runner._run_sequential(nb_episode=2,
+                                                 max_iter=self.max_iter)
+        assert len(res) == 2
+        for (i, _, cum_reward, timestep, total_ts), (i_seq, _, cum_reward_seq, timestep_seq, _) in zip(res, res_seq):
+            assert int(timestep) == self.max_iter
+            assert int(timestep) == int(timestep_seq)
+            assert np.abs(cum_reward - cum_reward_seq) <= self.tol_one
+
     def test_2episode_2process_detailed(self):
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore")
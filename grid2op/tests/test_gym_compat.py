@@ -902,6 +902,47 @@ class TestBoxGymActSpace(unittest.TestCase):
         assert np.all(np.isclose(grid2op_act.redispatch, grid2op_act3.redispatch))
 
 
+class TestBoxGymActSpaceBatch(unittest.TestCase):
+    """test the batch conversion of BoxGymActSpace, without the need to build a GymEnv"""
+    def _skip_if_no_gym(self):
+        if not GYM_AVAIL:
+            self.skipTest("Gym is not available")
+
+    def setUp(self) -> None:
+        self._skip_if_no_gym()
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("educ_case14_storage",
+                                    test=True,
+                                    action_class=PlayableAction,
+                                    _add_to_name="TestBoxGymActSpaceBatch")
+        self.obs_env = self.env.reset()
+
+    def tearDown(self) -> None:
+        self.env.close()
+
+    def test_from_gym_batch(self):
+        """test the batch conversion gives the same actions as the conversion one by one"""
+        kept_attr = ["set_bus", "change_bus", "redispatch", "set_storage"]
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            act_space = BoxGymActSpace(self.env.action_space,
+                                       attr_to_keep=kept_attr,
+                                       multiply={"redispatch": self.env.gen_max_ramp_up},
+                                       add={"set_storage": self.env.storage_max_p_prod}
+                                       )
+        act_space.seed(0)
+        acts_gym = np.stack([act_space.sample() for _ in range(5)])
+        acts_gym_init = acts_gym.copy()
+        grid2op_acts = act_space.from_gym_batch(acts_gym)
+        assert len(grid2op_acts) == 5
+        assert np.array_equal(acts_gym, acts_gym_init)  # gym actions are not modified
+        for act_gym, grid2op_act in zip(acts_gym, grid2op_acts):
+            assert isinstance(grid2op_act, PlayableAction)
+            assert grid2op_act == act_space.from_gym(act_gym)
+
+
 class TestMultiDiscreteGymActSpace(unittest.TestCase):
     def _skip_if_no_gym(self):
         if not GYM_AVAIL:
@@ -0,0 +1,86 @@
+# Copyright (c) 2019-2020, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import shutil
+import tempfile
+import warnings
+from unittest.mock import patch
+
+import grid2op
+from grid2op.tests.helper_path_test import *
+
+
+class TestTrainValSplit(unittest.TestCase):
+    def setUp(self) -> None:
+        # work on a copy of the environment: the split creates new environments next to it
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path_env = os.path.join(self.tmp_dir, "rte_case5_example")
+        shutil.copytree(os.path.join(PATH_CHRONICS_Make2, "rte_case5_example"),
+                        self.path_env,
+                        ignore=shutil.ignore_patterns("__pycache__"))
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make(self.path_env)
+        self.chronics_dir = self.env._chronics_folder_name()
+        self.all_chron = sorted(os.listdir(os.path.join(self.path_env, self.chronics_dir)))
+
+    def tearDown(self) -> None:
+        self.env.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def _get_chronics(self, env_name):
+        return sorted(os.listdir(os.path.join(self.tmp_dir, env_name, self.chronics_dir)))
+
+    def _check_split(self, nm_train, nm_val, val_scen_id):
+        for env_name in [nm_train, nm_val]:
+            path_split = os.path.join(self.tmp_dir, env_name)
+            # the files of the environment are linked in both the training and the validation environments
+            for el in os.listdir(self.path_env):
+                path_orig = os.path.join(self.path_env, el)
+                if os.path.isfile(path_orig):
+                    path_link = os.path.join(path_split, el)
+                    assert os.path.islink(path_link), f"{el} is not linked in {env_name}"
+                    assert os.readlink(path_link) == path_orig
+
+        # each chronics is linked in exactly one of the two environments
+        val_chron = self._get_chronics(nm_val)
+        train_chron = self._get_chronics(nm_train)
+        assert val_chron == sorted(val_scen_id)
+        assert train_chron == sorted(set(self.all_chron) - set(val_scen_id))
+        for env_name, chrons in [(nm_train, train_chron), (nm_val, val_chron)]:
+            for chron_name in chrons:
+                path_link = os.path.join(self.tmp_dir, env_name, self.chronics_dir, chron_name)
+                assert os.path.islink(path_link)
+                assert os.readlink(path_link) == os.path.join(self.path_env, self.chronics_dir, chron_name)
+
+    def test_split(self):
+        val_scen_id = ["01", "04", "12"]
+        nm_train, nm_val = self.env.train_val_split(val_scen_id)
+        self._check_split(nm_train, nm_val, val_scen_id)
+
+    def test_split_no_dir_fd(self):
+        """test the links are the same when the platform cannot create them relative to a directory descriptor"""
+        val_scen_id = ["00", "19"]
+        with patch.object(os, "supports_dir_fd", set()):
+            nm_train, nm_val = self.env.train_val_split(val_scen_id)
+        self._check_split(nm_train, nm_val, val_scen_id)
+
+    def test_split_random(self):
+        pct_val = 50.
+        self.env.seed(0)
+        nm_train, nm_val = self.env.train_val_split_random(pct_val=pct_val)
+        val_chron = self._get_chronics(nm_val)
+        train_chron = self._get_chronics(nm_train)
+        # no duplicates: exactly the requested number of chronics are in the validation set
+        assert len(val_chron) == int(len(self.all_chron) * pct_val / 100.)
+        assert not set(val_chron) & set(train_chron)
+        assert sorted(val_chron + train_chron) == self.all_chron
+
+
+if __name__ == "__main__":
+    unittest.main()